@@ -9,7 +9,7 @@
 # Import supporting modules
 import os
 import subprocess
-import re
+import time
 from enum import IntEnum
 
 # Import systemctl constant definitions
@@ -18,25 +18,47 @@ from systemctl.constants.DEnviron import DEnviron
 from systemctl.constants.DExitCode import DExitCode
 from systemctl.constants.DMsg import DMsg
 from systemctl.constants.DResult import DResult
-from systemctl.constants.DSystemCtl import DSystemCtl
+from systemctl.constants.DShow import DShow
+from systemctl.constants.DSystemCtl import (
+    DSystemCtl,
+    ENABLE as _ENABLE,
+    DISABLE as _DISABLE,
+    RESTART as _RESTART,
+    SHOW as _SHOW,
+    STATUS as _STATUS,
+    START as _START,
+    STOP as _STOP,
+)
+
+# Environment for every systemctl invocation, built once at import time.
+# Make sure systemd doesn't clutter the output with color codes or use a
+# pager, and force the C locale so the output is plain ASCII.
+_SYSTEMCTL_ENV = {
+    **os.environ,
+    DEnviron.SYSTEMD_COLORS: "0",
+    DEnviron.SYSTEMD_PAGER: "",
+    DEnviron.LC_ALL: "C",
+}
 
 
 class SystemCtl:
 
     def __init__(self, service_name=None):
-        # Make sure systemd doesn't clutter the output with color codes or use a pager
-        os.environ[DEnviron.SYSTEMD_COLORS] = "0"
-        os.environ[DEnviron.SYSTEMD_PAGER] = ""
         self.result = {
             DResult.ACTIVE: None,
             DResult.PID: None,
             DResult.ENABLED: None,
-            DResult.RAW_STDOUT: "",
-            DResult.RAW_STDERR: "",
+            DResult.RAW_STDOUT: b"",
+            DResult.RAW_STDERR: b"",
         }
         self._service_name = service_name
+        self._show_argv = self._build_show_argv()
         self._timeout = DSystemCtl.TIMEOUT
-        self._update_status()
+        self._cache_ttl = DSystemCtl.CACHE_TTL
+        self._status_ts = 0.0
+        # Defer the first refresh until a name is set via service_name()
+        if service_name is not None:
+            self._update_status()
 
     def start(self):
         """
@@ -106,6 +128,8 @@ class SystemCtl:
         if service_name:
             self._service_name = service_name
             if service_name != old_service_name:
+                self._show_argv = self._build_show_argv()
+                self._status_ts = 0.0
                 self._update_status()
         return self._service_name
 
@@ -114,6 +138,7 @@ class SystemCtl:
         :return: Whether or not the service is enabled.
         :rtype: bool
         """
+        self._update_status()
         return self.result[DResult.ENABLED]
 
     def installed(self):
@@ -121,7 +146,7 @@ class SystemCtl:
         :return: Whether the service is present at all.
         :rtype: bool
         """
-        return not self.stderr()
+        return self.result[DResult.ACTIVE] is not None
 
     def running(self):
         """
@@ -136,57 +161,166 @@ class SystemCtl:
         :return: The PID of the running service.
         :rtype: int
         """
+        self._update_status()
         return self.result[DResult.PID]
 
+    def status(self):
+        """
+        Run a 'systemctl status service_name' command and return its
+        human-readable output. State queries use 'systemctl show'
+        internally; this is for debugging and display.
+
+        :return: The raw STDOUT of the systemctl status command.
+        :rtype: str
+        """
+        if not self._service_name:
+            raise ValueError(DMsg.NO_SERVICE_NAME)
+        self._run_systemctl(DSystemCtl.STATUS)
+        return self.stdout()
+
+    def _build_show_argv(self):
+        """
+        Precompute the argv for the polled 'systemctl show' command so
+        each status refresh doesn't rebuild it.
+        """
+        if not self._service_name:
+            return None
+        return (DCmd.SYSTEMCTL, DSystemCtl.SHOW, DShow.PROPERTIES, self._service_name)
+
     def _update_status(self):
         """
         (Re)load the instance's result's dictionary.
         """
+        # Without a service name there is no state to load
         if not self._service_name:
-            raise ValueError(DMsg.NO_SERVICE_NAME)
+            return
 
-        self._run_systemctl(DSystemCtl.STATUS)
-        stdout = self.stdout()
-        stderr = self.stderr()
+        # Reuse the cached state if it is still fresh
+        if time.monotonic() - self._status_ts < self._cache_ttl:
+            return
+
+        self._run_systemctl(DSystemCtl.SHOW)
+        stdout = self.result[DResult.RAW_STDOUT]
+        stderr = self.result[DResult.RAW_STDERR]
 
-        if DMsg.NOT_FOUND in stderr:
+        if DMsg.NOT_FOUND_B in stderr:
             self.result[DResult.ACTIVE] = None
             self.result[DResult.PID] = None
             self.result[DResult.ENABLED] = None
+            self._status_ts = time.monotonic()
             return
 
-        # Check for active state
-        if re.search(r"^\s*Active:\s+active \(running\).*", stdout, re.MULTILINE):
-            self.result[DResult.ACTIVE] = True
-        elif re.search(r"^\s*Main PID:.*\(code=exited\).*", stdout, re.MULTILINE):
-            self.result[DResult.ACTIVE] = False
-        elif re.search(r"^\s*Active:\s+inactive \(dead\).*", stdout, re.MULTILINE):
-            self.result[DResult.ACTIVE] = False
+        # Nothing to parse, e.g. the command timed out and stdout is
+        # empty; leave the cache stale so the next call retries
+        if not stdout:
+            return
 
-        # Check for enabled state
-        if re.search(r"Loaded: .*; enabled;", stdout):
-            self.result[DResult.ENABLED] = True
-        elif re.search(r"Loaded: .*; disabled;", stdout):
-            self.result[DResult.ENABLED] = False
+        self.result.update(self._parse_show_block(stdout))
+        self._status_ts = time.monotonic()
 
-        # Get PID
-        pid_match = re.search(r"^\s*Main PID:\s+(\d+)", stdout, re.MULTILINE)
-        if pid_match and self.result[DResult.ACTIVE]:
-            self.result[DResult.PID] = int(pid_match.group(1))
+    @staticmethod
+    def _parse_show_block(block):
+        """
+        Parse one block of 'systemctl show' key=value output into a
+        dictionary of DResult fields.
+        """
+        result = {
+            DResult.ACTIVE: None,
+            DResult.PID: None,
+            DResult.ENABLED: None,
+        }
+        # 'systemctl show' prints one 'Property=value' line per property
+        props = dict(
+            line.split(b"=", 1) for line in block.splitlines() if b"=" in line
+        )
+
+        # No properties at all means the command failed rather than the
+        # unit being inactive, so the state stays unknown
+        if not props:
+            return result
+
+        if props.get(DShow.LOAD_STATE) == DShow.NOT_FOUND:
+            return result
+
+        result[DResult.ACTIVE] = props.get(DShow.ACTIVE_STATE) == DShow.ACTIVE
+        result[DResult.ENABLED] = props.get(DShow.UNIT_FILE_STATE) in (
+            DShow.ENABLED,
+            DShow.ENABLED_RUNTIME,
+        )
+        pid = props.get(DShow.MAIN_PID, DShow.NO_PID)
+        if pid.isdigit() and pid != DShow.NO_PID:
+            result[DResult.PID] = int(pid)
+        return result
+
+    @classmethod
+    def status_many(cls, service_names, timeout=DSystemCtl.TIMEOUT):
+        """
+        Query the state of several services with a single 'systemctl
+        show' call instead of one subprocess per service.
+
+        :param: The service names to query.
+        :type: list
+        :param: Optional timeout value for the systemctl command.
+        :type: int
+        :return: A dictionary mapping each service name to a dictionary
+            with the DResult.ACTIVE, DResult.PID and DResult.ENABLED
+            fields.
+        :rtype: dict
+        """
+        service_names = list(service_names)
+        results = {
+            name: {DResult.ACTIVE: None, DResult.PID: None, DResult.ENABLED: None}
+            for name in service_names
+        }
+        if not service_names:
+            return results
+
+        cmd = (DCmd.SYSTEMCTL, DSystemCtl.SHOW, DShow.PROPERTIES, *service_names)
+        try:
+            proc = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                stdin=subprocess.DEVNULL,
+                timeout=timeout,
+                env=_SYSTEMCTL_ENV,
+            )
+        except Exception:
+            return results
+
+        # With several units, show separates the property blocks with a
+        # blank line, in argument order
+        for name, block in zip(service_names, proc.stdout.split(b"\n\n")):
+            results[name] = cls._parse_show_block(block)
+        return results
 
     def stdout(self):
         """
-        :return: The raw STDOUT of a 'systemctl status service_name' command.
+        :return: The raw STDOUT of the last systemctl command.
         :rtype: str
         """
-        return self.result[DResult.RAW_STDOUT]
+        return self.result[DResult.RAW_STDOUT].decode(errors="replace")
 
     def stderr(self):
         """
-        :return: The raw STDERR of a 'systemctl status service_name' command.
+        :return: The raw STDERR of the last systemctl command.
         :rtype: str
         """
-        return self.result[DResult.RAW_STDERR]
+        return self.result[DResult.RAW_STDERR].decode(errors="replace")
+
+    def cache_ttl(self, ttl=None):
+        """
+        Get/Set how long (in seconds) cached status results are reused
+        before a fresh 'systemctl show' is run.
+
+        :param: Optional time-to-live value in seconds.
+        :type: float
+        :return: The time-to-live value.
+        :rtype: float
+        """
+        if ttl is not None:
+            self._cache_ttl = ttl
+        return self._cache_ttl
 
     def timeout(self, timeout=None):
         """
@@ -204,38 +338,56 @@ class SystemCtl:
         Execute a 'systemctl [start|stop|restart|status|enable|disable] service_name'
         command and load the instance's result dictionary.
         """
-        if arg == DSystemCtl.STATUS:
+        # All callers pass the DSystemCtl verbs, so identity comparison
+        # against the module-level aliases is safe and skips __eq__
+        if arg is _SHOW:
+            cmd = self._show_argv
+        elif arg is _STATUS:
             cmd = [DCmd.SYSTEMCTL, arg, self._service_name]
         else:
             cmd = [DCmd.SUDO, DCmd.SYSTEMCTL, arg, self._service_name]
 
+        # start/stop/restart only need the exit code and error message,
+        # so don't bother setting up a stdout pipe for them
+        if arg is _START or arg is _STOP or arg is _RESTART:
+            stdout_dest = subprocess.DEVNULL
+        else:
+            stdout_dest = subprocess.PIPE
+
         try:
             proc = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=stdout_dest,
                 stderr=subprocess.PIPE,
-                input="",
+                stdin=subprocess.DEVNULL,
                 timeout=self._timeout,
+                env=_SYSTEMCTL_ENV,
             )
-            stdout = proc.stdout.decode(errors="replace")
-            stderr = proc.stderr.decode(errors="replace")
 
         except subprocess.TimeoutExpired:
-            self.result[DResult.RAW_STDOUT] = ""
-            self.result[DResult.RAW_STDERR] = DMsg.TIMEOUT
+            self.result[DResult.RAW_STDOUT] = b""
+            self.result[DResult.RAW_STDERR] = DMsg.TIMEOUT_B
             return DExitCode.ERROR
 
         except Exception as e:
-            self.result[DResult.RAW_STDOUT] = ""
-            self.result[DResult.RAW_STDERR] = str(e)
+            self.result[DResult.RAW_STDOUT] = b""
+            self.result[DResult.RAW_STDERR] = str(e).encode(errors="replace")
             return DExitCode.ERROR
 
-        self.result[DResult.RAW_STDOUT] = stdout
-        self.result[DResult.RAW_STDERR] = stderr
+        # Keep the output as raw bytes; stdout()/stderr() decode on demand
+        self.result[DResult.RAW_STDOUT] = proc.stdout or b""
+        self.result[DResult.RAW_STDERR] = proc.stderr
 
-        if arg == DSystemCtl.ENABLE or arg == DSystemCtl.DISABLE:
-            # Reload the status information
-            self._update_status()
+        # State-changing commands invalidate the cached status
+        if arg is not _SHOW and arg is not _STATUS:
+            self._status_ts = 0.0
+
+        # The caller just changed the enabled state, so record it directly
+        # rather than re-running systemctl to find out what we already know
+        if arg is _ENABLE and proc.returncode == 0:
+            self.result[DResult.ENABLED] = True
+        elif arg is _DISABLE and proc.returncode == 0:
+            self.result[DResult.ENABLED] = False
 
         # Return the return code for the systemctl command
         return proc.returncode
@@ -6,9 +6,13 @@
 #    GitHub: https://github.com/NadimGhaznavi/systemctl
 #    License: GPL 3.0
 
+import shutil
+
 
 class DCmd:
     """Constants related to the runtime systemctl CLI environment."""
 
-    SUDO: str = "sudo"
-    SYSTEMCTL: str = "systemctl"
+    # Resolve the absolute paths once at import time so subprocess exec
+    # doesn't walk PATH on every invocation
+    SUDO: str = shutil.which("sudo") or "/usr/bin/sudo"
+    SYSTEMCTL: str = shutil.which("systemctl") or "/usr/bin/systemctl"
@@ -12,3 +12,4 @@ class DEnviron:
 
     SYSTEMD_COLORS: str = "SYSTEMD_COLORS"
     SYSTEMD_PAGER: str = "SYSTEMD_PAGER"
+    LC_ALL: str = "LC_ALL"
@@ -13,3 +13,6 @@ class DMsg:
     NO_SERVICE_NAME: str = "service name not specified"
     NOT_FOUND: str = "could not be found"
     TIMEOUT: str = "systemctl timed out"
+    # Bytes twins for matching against raw, undecoded systemctl output
+    NOT_FOUND_B: bytes = b"could not be found"
+    TIMEOUT_B: bytes = b"systemctl timed out"
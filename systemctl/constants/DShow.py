@@ -0,0 +1,24 @@
+# constants/DShow.py
+#
+#    systemctl - A Python wrapper for the systemctl command line utility.
+#    Author: Nadim-Daniel Ghaznavi
+#    Copyright: (c) 2025 Nadim-Daniel Ghaznavi
+#    GitHub: https://github.com/NadimGhaznavi/systemctl
+#    License: GPL 3.0
+
+
+class DShow:
+    """Constants related to 'systemctl show' properties."""
+
+    PROPERTIES: str = "--property=ActiveState,SubState,UnitFileState,MainPID,LoadState"
+    # The command output is parsed as raw bytes, so the property names
+    # and values are bytes
+    ACTIVE_STATE: bytes = b"ActiveState"
+    UNIT_FILE_STATE: bytes = b"UnitFileState"
+    MAIN_PID: bytes = b"MainPID"
+    LOAD_STATE: bytes = b"LoadState"
+    ACTIVE: bytes = b"active"
+    ENABLED: bytes = b"enabled"
+    ENABLED_RUNTIME: bytes = b"enabled-runtime"
+    NOT_FOUND: bytes = b"not-found"
+    NO_PID: bytes = b"0"
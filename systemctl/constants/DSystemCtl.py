@@ -13,7 +13,20 @@ class DSystemCtl:
     ENABLE: str = "enable"
     DISABLE: str = "disable"
     RESTART: str = "restart"
+    SHOW: str = "show"
     STATUS: str = "status"
     START: str = "start"
     STOP: str = "stop"
     TIMEOUT: int = 10
+    CACHE_TTL: float = 0.5
+
+
+# Module-level aliases of the command verbs so hot code paths can bind
+# them as locals and skip the class attribute lookup
+ENABLE: str = DSystemCtl.ENABLE
+DISABLE: str = DSystemCtl.DISABLE
+RESTART: str = DSystemCtl.RESTART
+SHOW: str = DSystemCtl.SHOW
+STATUS: str = DSystemCtl.STATUS
+START: str = DSystemCtl.START
+STOP: str = DSystemCtl.STOP